@@ -6,23 +6,22 @@ Attributes:
 """
 
 # Import standard modules
-from ast import literal_eval
 from enum import Enum
+from functools import lru_cache
 from os import getenv
 from pathlib import Path
 from string import Template
-from typing import Any, List, Optional, Sequence
-
-# Import third-party modules
-from docker import DockerClient
-from docker.errors import ImageNotFound
-from docker.models.containers import Container as DockerContainer
-from requests import head as get_head
+from typing import Any, Dict, List, Optional, Sequence, TYPE_CHECKING
 
 # Import internal modules
 from .lang import BatCaveError, BatCaveException, CommandResult, WIN32
 from .sysutil import SysCmdRunner
 
+# Import third-party modules (the docker and requests modules are imported only where they are used since they are slow to load)
+if TYPE_CHECKING:
+    from docker import DockerClient
+    from docker.models.containers import Container as DockerContainer
+
 CloudType = Enum('CloudType', ('local', 'gcloud', 'dockerhub'))
 
 # pylint: disable=invalid-name
@@ -52,6 +51,17 @@ class CloudError(BatCaveException):
     INVALID_TYPE = BatCaveError(3, Template('Invalid Cloud type ($ctype). Must be one of: ' + str([t.name for t in CloudType])))
 
 
+@lru_cache(maxsize=1)
+def _default_docker_client() -> 'DockerClient':
+    """Return a Docker client shared by all objects that do not have one from their cloud.
+
+    Returns:
+        The shared Docker client.
+    """
+    from docker import DockerClient  # pylint: disable=import-outside-toplevel
+    return DockerClient()
+
+
 class Cloud:
     """Class to create a universal abstract interface for a cloud instance."""
 
@@ -148,6 +158,7 @@ class Cloud:
         Returns:
             Nothing.
         """
+        from docker import DockerClient  # pylint: disable=import-outside-toplevel
         self._client = DockerClient()
         if self.type == CloudType.dockerhub:
             self._client.login(*self.auth)
@@ -168,10 +179,13 @@ class Image:
             _name: The value of the name argument.
             _ref: A reference to the underlying API object.
         """
+        from docker import DockerClient  # pylint: disable=import-outside-toplevel
+        from docker.errors import ImageNotFound  # pylint: disable=import-outside-toplevel
         self._cloud = cloud
         self._name = name
-        self._docker_client: DockerClient = self.cloud.client if isinstance(self.cloud.client, DockerClient) else DockerClient()
+        self._docker_client: DockerClient = self.cloud.client if isinstance(self.cloud.client, DockerClient) else _default_docker_client()
         if self._cloud.type == CloudType.dockerhub:
+            from requests import head as get_head  # pylint: disable=import-outside-toplevel
             (image, tag) = self.name.split(':', 1)
             response = get_head(f'https://registry.hub.docker.com/v2/{image}/manifests/{tag}', auth=self._cloud.auth,
                                 headers={"Accept": "application/vnd.docker.distribution.manifest.v2+json"}, timeout=10)
@@ -213,19 +227,19 @@ class Image:
         self._ref = self._docker_client.images.pull(self.name)
         return self
 
-    def push(self) -> List[str]:
+    def push(self) -> List[Dict[str, Any]]:
         """Push the image to the registry.
 
         Returns:
             The server log from the push.
         """
-        docker_log = [literal_eval(line.strip()) for line in self._docker_client.images.push(self.name).splitlines() if line]
+        docker_log = list(self._docker_client.images.push(self.name, stream=True, decode=True))
         errors = [line['error'] for line in docker_log if 'error' in line]
         if errors:
             raise CloudError(CloudError.IMAGE_ERROR, action='push', err=''.join(errors))
         return docker_log
 
-    def run(self, *, detach: bool = True, update: bool = True, **kwargs) -> DockerContainer:
+    def run(self, *, detach: bool = True, update: bool = True, **kwargs) -> 'DockerContainer':
         """Run an image to create an active container.
 
         Args:
@@ -296,7 +310,7 @@ class Container:
     cloud = property(lambda s: s._cloud, doc='A read-only property which returns the container cloud object.')
     name = property(lambda s: s._name, doc='A read-only property which returns the name of the container.')
 
-    def stop(self) -> DockerContainer:
+    def stop(self) -> 'DockerContainer':
         """Stop a running container.
 
         Returns:
@@ -15,6 +15,7 @@ from datetime import datetime
 from enum import Enum
 from glob import glob
 from collections.abc import Callable
+from contextlib import chdir
 from getpass import getuser
 from os import PathLike, environ, getenv
 from pathlib import Path
@@ -28,7 +29,7 @@ from typing import cast, Any, Dict, Generator, Iterable, List, Optional, Pattern
 
 # Import internal modules
 from .fileutil import slurp
-from .sysutil import popd, pushd, rmtree_hard
+from .sysutil import rmtree_hard
 from .lang import is_debug, BatCaveError, BatCaveException, PathName
 
 if sys.platform == 'win32':
@@ -633,10 +634,8 @@ class Client:
         """
         match self._type:
             case ClientType.file:
-                pushd(self.root)
-                files: List[str] = glob('**')
-                popd()
-                return files
+                with chdir(self.root):
+                    return glob('**')
             case ClientType.git:
                 return [f'{root}/{f}' for (root, _unused_dirs, files) in walk_git_tree(self._client.tree()) for f in files]
             case ClientType.perforce:
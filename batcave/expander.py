@@ -51,6 +51,8 @@ from xml.etree.ElementTree import fromstringlist as xml_parse, Element
 from .fileutil import slurp
 from .lang import DEFAULT_ENCODING, is_debug, str_to_pythonval, BatCaveError, BatCaveException, PathName, WIN32
 
+_FILE_BUFFER_SIZE = 1 << 20
+
 OutputFormat = Enum('OutputFormat', ('text', 'html', 'csv'))
 
 
@@ -396,12 +398,10 @@ class Expander:
         Returns:
             Nothing.
         """
-        with open(in_file, encoding=DEFAULT_ENCODING) as in_stream:
+        with open(in_file, encoding=DEFAULT_ENCODING, buffering=_FILE_BUFFER_SIZE) as in_stream:
             Path(out_file).parent.mkdir(parents=True, exist_ok=True)
-            with open(out_file, 'w', encoding=DEFAULT_ENCODING) as out_stream:
-                for line in in_stream:
-                    line = self.expand(line)
-                    out_stream.write(line)
+            with open(out_file, 'w', encoding=DEFAULT_ENCODING, buffering=_FILE_BUFFER_SIZE) as out_stream:
+                out_stream.writelines(self.expand(line) for line in in_stream)
 
 
 def file_expander(in_file: PathName, out_file: PathName, /, *, var_dict: Optional[Dict[str, str]] = None, var_props: Any = None) -> None:
@@ -8,6 +8,7 @@ Attributes:
 
 # Import standard modules
 from bz2 import BZ2File
+from contextlib import chdir, nullcontext
 from enum import Enum
 from gzip import GzipFile
 from logging import getLogger
@@ -22,7 +23,6 @@ from typing import Any, Iterable, List, Optional, Tuple
 from zipfile import ZipFile, ZIP_DEFLATED
 
 # Import internal modules
-from .sysutil import popd, pushd
 from .lang import DEFAULT_ENCODING, BatCaveError, BatCaveException, PathName
 
 
@@ -136,46 +136,39 @@ def pack(archive_file: PathName, items: Iterable, /, item_location: Optional[Pat
     archive = Path(archive_file)
     archive_type = archive.suffix.lstrip('.') if not archive_type else archive_type
 
-    if item_location:
-        pushd(item_location)
-
-    tar_name = Path()
-    tar_bug = False
-    pkg_file = None
-    if archive_type == 'zip':
-        pkg_file = PACKER_CLASSES[archive_type](archive, 'w', ZIP_DEFLATED)
-        adder = 'write'
-    else:
-        if compression := COMPRESSION_TYPE.get(archive_type, ''):
-            tar_name = archive.with_suffix('.tar')
-            tar_bug = True
+    with chdir(item_location) if item_location else nullcontext():
+        tar_name = Path()
+        tar_bug = False
+        pkg_file = None
+        if archive_type == 'zip':
+            pkg_file = PACKER_CLASSES[archive_type](archive, 'w', ZIP_DEFLATED)
+            adder = 'write'
         else:
-            tar_name = archive
-
-        pkg_file = tar_open(tar_name, mode='w:' + compression)  # type: ignore[call-overload]  # pylint: disable=consider-using-with
-        adder = 'add'
-
-    added = False
-    for glob_item in [Path(i) for i in items]:
-        for item in glob_item.parent.glob(glob_item.name):
-            added = True
-            if (adder == 'write') and item.is_dir():
-                for (root, _unused_dirs, files) in item.walk():
-                    for files_name in files:
-                        getattr(pkg_file, adder)(Path(root, files_name))
+            if compression := COMPRESSION_TYPE.get(archive_type, ''):
+                tar_name = archive.with_suffix('.tar')
+                tar_bug = True
             else:
-                getattr(pkg_file, adder)(item)
-    pkg_file.close()
-    if (not ignore_empty) and (not added):
-        raise PackError(PackError.NO_FILES)
+                tar_name = archive
 
-    if tar_bug:
-        if archive.exists():
-            archive.unlink()
-        tar_name.rename(archive)
+            pkg_file = tar_open(tar_name, mode='w:' + compression)  # type: ignore[call-overload]  # pylint: disable=consider-using-with
+            adder = 'add'
 
-    if item_location:
-        popd()
+        added = False
+        for glob_item in [Path(i) for i in items]:
+            for item in glob_item.parent.glob(glob_item.name):
+                added = True
+                if (adder == 'write') and item.is_dir():
+                    for (root, _unused_dirs, files) in item.walk():
+                        for files_name in files:
+                            getattr(pkg_file, adder)(Path(root, files_name))
+                else:
+                    getattr(pkg_file, adder)(item)
+        pkg_file.close()
+        if (not ignore_empty) and (not added):
+            raise PackError(PackError.NO_FILES)
+
+        if tar_bug:
+            tar_name.replace(archive)
 
 
 def prune(directory: PathName, age: int, exts: Optional[Iterable[str]] = None,
@@ -230,7 +223,8 @@ def slurp(filename: PathName, /) -> List[str]:
     Returns:
         The list of lines from the file.
     """
-    return list(open(filename, encoding=DEFAULT_ENCODING))
+    with open(filename, encoding=DEFAULT_ENCODING) as input_stream:
+        return input_stream.readlines()
 
 
 def spew(filename: PathName, outlines: Iterable, /) -> None:
@@ -269,33 +263,30 @@ def unpack(archive_file: PathName, dest: Optional[PathName] = None, /, *, archiv
     if dest:
         use_dest = Path(dest)
         use_dest.mkdir(parents=True, exist_ok=True)
-        pushd(use_dest)
-
-    lister = extractor = ''
-    pkg_file: Any = None
-    match archive_type:
-        case 'bz2' | 'gz' | 'xz' | 'zip':
-            pkg_file = PACKER_CLASSES[archive_type](archive)
-            lister = 'namelist'
-            extractor = 'read'
-        case 'tar':
-            pkg_file = tar_open(archive)  # pylint: disable=consider-using-with
-            lister = 'getmembers'
-            extractor = 'extract'
-        case _:
-            raise PackError(PackError.INVALID_TYPE, arc_type=archive_type)
-
-    for member_info in getattr(pkg_file, lister)():
-        member_path = Path(member_info.name if (archive_type == 'tar') else member_info)
-        data = getattr(pkg_file, extractor)(member_info)
-        if extractor == 'read':
-            member_path.parent.mkdir(parents=True, exist_ok=True)
-            if not (member_path.is_dir() or member_info.endswith('/')):
-                with open(member_path, 'wb') as member_file:
-                    member_file.write(data)
-    pkg_file.close()
 
-    if dest:
-        popd()
+    with chdir(use_dest) if dest else nullcontext():
+        lister = extractor = ''
+        pkg_file: Any = None
+        match archive_type:
+            case 'bz2' | 'gz' | 'xz' | 'zip':
+                pkg_file = PACKER_CLASSES[archive_type](archive)
+                lister = 'namelist'
+                extractor = 'read'
+            case 'tar':
+                pkg_file = tar_open(archive)  # pylint: disable=consider-using-with
+                lister = 'getmembers'
+                extractor = 'extract'
+            case _:
+                raise PackError(PackError.INVALID_TYPE, arc_type=archive_type)
+
+        for member_info in getattr(pkg_file, lister)():
+            member_path = Path(member_info.name if (archive_type == 'tar') else member_info)
+            data = getattr(pkg_file, extractor)(member_info)
+            if extractor == 'read':
+                member_path.parent.mkdir(parents=True, exist_ok=True)
+                if not (member_path.is_dir() or member_info.endswith('/')):
+                    with open(member_path, 'wb') as member_file:
+                        member_file.write(data)
+        pkg_file.close()
 
 # cSpell:ignore topdown
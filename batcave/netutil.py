@@ -5,7 +5,8 @@ from smtplib import SMTP
 from typing import Dict, Optional, Tuple, Callable
 
 # Import third-party modules
-from requests import get as url_get, PreparedRequest
+from requests import get as url_get, PreparedRequest, Session
+from requests.adapters import HTTPAdapter, Retry
 from requests.auth import AuthBase
 
 # Import internal modules
@@ -34,6 +35,23 @@ def download(url: str, /, target: Optional[str] = None, *, auth: Optional[Tuple[
         downloaded_file.write(response.content)
 
 
+def pooled_session(auth: Optional[Tuple[str, str] | AuthBase | Callable[[PreparedRequest], PreparedRequest]] = None, /) -> Session:
+    """Create an HTTP session which keeps connections alive between requests and retries failed connections.
+
+    Args:
+        auth (optional, default=None): If not None, the authorization used for every request made through the session.
+
+    Returns:
+        The session.
+    """
+    session = Session()
+    session.auth = auth
+    adapter = HTTPAdapter(pool_maxsize=8, max_retries=Retry(total=3, backoff_factor=0.3))
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
 def send_email(smtp_server: str, receiver: str, sender: str, subject: str, body: str, /,
                content_type: str = 'text/plain') -> Dict[str, Tuple[int, bytes]]:
     """Send an SMTP email message.
@@ -3,18 +3,38 @@
 
 # Import standard modules
 from enum import Enum
-from pathlib import Path
-from platform import uname
+from functools import cached_property, lru_cache
+from os import scandir
+from platform import uname as _uname, uname_result
 from sys import version_info
+from typing import Dict
 
 OsType = Enum('OsType', ('linux', 'windows'))
 
 
+@lru_cache(maxsize=1)
+def uname() -> uname_result:
+    """Return the cached result of platform.uname() since it does not change within a process."""
+    return _uname()
+
+
+@lru_cache(maxsize=1)
+def _linux_build() -> str:
+    """Return the first line of the Linux release file, read only once per process."""
+    with scandir('/etc') as etc_entries:
+        for entry in etc_entries:
+            if entry.name.endswith('-release'):
+                with open(entry.path) as release_file:
+                    return release_file.readline().strip()
+    return 'unknown'
+
+
 class Platform:
     """A class to provide a simplified interface to the platform and sys.version_info standard modules."""
 
-    def __getattr__(self, attr: str) -> str:
-        """Get the platform type formatted for the requested subtype."""
+    @cached_property
+    def _os_detect(self) -> Dict[str, str]:
+        """A read-only property which returns the platform components from which the platform types are built."""
         sys_info = uname()
         batcave_os = bart_os = sys_info.system.replace('-', '')
         batcave_version = batcave_arch = ''
@@ -40,10 +60,7 @@ class Platform:
                     batcave_arch = 'i686'
                 else:
                     batcave_arch = sys_info.machine
-                try:
-                    build = open([f for f in Path('/etc').glob('*-release')][0]).readline().strip()
-                except IndexError:
-                    build = 'unknown'
+                build = _linux_build()
 
                 p4ver = batcave_version
                 if (p4_arch := sys_info.processor.replace(' ', '_')) in ('i686', 'i386', 'athalon'):
@@ -67,17 +84,36 @@ class Platform:
                     bart_os = 'win32'
                 build = f'{sys_info.system} {sys_info.release} {p4_arch[1:]}-bit ({sys_info.version})'
 
-        match attr:
-            case 'bart':
-                return bart_os + bart_version + bart_arch
-            case 'distutils':
-                return '%s-%s-%s' % (du_os, uname().machine.lower(), '.'.join([str(i) for i in version_info[:2]]))
-            case 'batcave_run':
-                return batcave_os + batcave_version + batcave_arch
-            case 'batcave_build':
-                return build
-            case 'p4':
-                return '%s%s%s' % (batcave_os.lower().replace('windows', 'nt'), p4ver, p4_arch)
-        raise AttributeError(f'Unknown platform type: {attr}')
+        return {'batcave_os': batcave_os, 'batcave_version': batcave_version, 'batcave_arch': batcave_arch,
+                'bart_os': bart_os, 'bart_version': bart_version, 'bart_arch': bart_arch,
+                'p4ver': p4ver, 'p4_arch': p4_arch, 'du_os': du_os, 'build': build}
+
+    @cached_property
+    def bart(self) -> str:
+        """A read-only property which returns the platform type for BART."""
+        os_info = self._os_detect
+        return os_info['bart_os'] + os_info['bart_version'] + os_info['bart_arch']
+
+    @cached_property
+    def distutils(self) -> str:
+        """A read-only property which returns the platform type in distutils format."""
+        return '%s-%s-%s' % (self._os_detect['du_os'], uname().machine.lower(), '.'.join([str(i) for i in version_info[:2]]))
+
+    @cached_property
+    def batcave_run(self) -> str:
+        """A read-only property which returns the platform type for the BatCave runtime."""
+        os_info = self._os_detect
+        return os_info['batcave_os'] + os_info['batcave_version'] + os_info['batcave_arch']
+
+    @cached_property
+    def batcave_build(self) -> str:
+        """A read-only property which returns the platform build description."""
+        return self._os_detect['build']
+
+    @cached_property
+    def p4(self) -> str:
+        """A read-only property which returns the platform type for Perforce."""
+        os_info = self._os_detect
+        return '%s%s%s' % (os_info['batcave_os'].lower().replace('windows', 'nt'), os_info['p4ver'], os_info['p4_arch'])
 
 # cSpell:ignore batcave
@@ -5,11 +5,12 @@ from typing import cast, Any, Dict, List, Optional, Union
 from xml.etree.ElementTree import fromstring, tostring, Element
 
 # Import third-party modules
-from requests import codes, delete as req_del, get as req_get, post as req_post, Response
+from requests import codes, Response
 from requests.exceptions import HTTPError
 
 # Import internal modules
 from .lang import bool_to_str
+from .netutil import pooled_session
 
 
 class QuickBuildObject:
@@ -223,12 +224,15 @@ class QuickBuildConsole:
         Attributes:
             _host: The value of the host argument.
             _password: The value of the password argument.
+            _session: The HTTP session through which the API calls are made.
+                It holds a pooled connection which is only closed by __exit__, so use the console in a with statement.
             _update: When True, the internal values need to be refreshed from the API.
             _user: The value of the user argument.
         """
         self._host = host
         self._user = user
         self._password = password
+        self._session = pooled_session((self._user, self._password))
         self._update = True
         self.configs: Dict[str, QuickBuildCfg] = {}
         self.dashboards: Dict[str, QuickBuildDashboard] = {}
@@ -238,6 +242,7 @@ class QuickBuildConsole:
         return self
 
     def __exit__(self, *exc_info):
+        self._session.close()
         return False
 
     def __getattr__(self, attr: str) -> QuickBuildCfg:
@@ -308,13 +313,13 @@ class QuickBuildConsole:
         """
         caller: Any = None
         api_call = f'http://{self._host}/rest/{cmd}'
-        api_args: Dict[str, Any] = {'auth': (self._user, self._password)}
+        api_args: Dict[str, Any] = {}
         if delete:
-            caller = req_del
+            caller = self._session.delete
         elif xml_data is None:
-            caller = req_get
+            caller = self._session.get
         else:
-            caller = req_post
+            caller = self._session.post
             api_args['data'] = xml_data if isinstance(xml_data, str) else tostring(xml_data)
         if (result := caller(api_call, **api_args)).status_code != codes.ok:  # pylint: disable=no-member
             result.raise_for_status()
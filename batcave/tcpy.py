@@ -6,12 +6,12 @@ from string import Template
 from typing import Any, Dict, Optional
 
 # Import third-party modules
-import requests
 from requests import certs, codes, exceptions  # type: ignore[attr-defined]
 from requests.auth import HTTPBasicAuth
 
 # Import internal modules
 from .lang import BatCaveError, BatCaveException, FROZEN, BATCAVE_HOME
+from .netutil import pooled_session
 
 
 class TeamCityError(BatCaveException):
@@ -69,14 +69,18 @@ class TeamCityServer:
         Attributes:
             url: The URL to the Teamcity RESTful API.
             auth: The authorization credentials for the Teamcity server.
+            _session: The authorized HTTP session used to call the Teamcity API.
+                It holds a pooled connection which is only closed by __exit__, so use the server in a with statement.
         """
         self.url = f'http://{host}:{port}/httpAuth/app/rest/'
         self.auth = HTTPBasicAuth(user, passwd)
+        self._session = pooled_session(self.auth)
 
     def __enter__(self):
         return self
 
     def __exit__(self, *exc_info):
+        self._session.close()
         return False
 
     build_configs = property(lambda s: s.api_call('get', 'buildTypes')['buildType'], doc='A read-only property which returns a list of the build configurations.')
@@ -97,8 +101,8 @@ class TeamCityServer:
         Raises:
             An error unless the result of the API call is OK.
         """
-        caller = getattr(requests, call_type)
-        result = caller(self.url + api_call, auth=self.auth, headers={'Content-Type': 'application/json', 'Accept': 'application/json'}, json=params, verify=self._CA_CERT)
+        caller = getattr(self._session, call_type)
+        result = caller(self.url + api_call, headers={'Content-Type': 'application/json', 'Accept': 'application/json'}, json=params, verify=self._CA_CERT)
         if result.status_code != codes.ok:  # pylint: disable=no-member
             raise result.raise_for_status()
         return result.json()
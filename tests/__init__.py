@@ -2,12 +2,13 @@
 import sys
 from pathlib import Path
 
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
 # Ensure the local source tree takes precedence over any installed version
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(_PROJECT_ROOT))
 
-# Force reimport of batcave from the local source
-if 'batcave' in sys.modules:
+# Force reimport of batcave from the local source if an installed version was already imported
+if (_batcave := sys.modules.get('batcave')) and (not _batcave.__file__ or Path(_batcave.__file__).resolve().parent.parent != _PROJECT_ROOT):
     # Remove all batcave submodules from the cache
-    for mod_name in list(sys.modules):
-        if mod_name == 'batcave' or mod_name.startswith('batcave.'):
-            del sys.modules[mod_name]
+    for mod_name in [m for m in sys.modules if m == 'batcave' or m.startswith('batcave.')]:
+        del sys.modules[mod_name]
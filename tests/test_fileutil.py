@@ -11,7 +11,7 @@ from tempfile import mkdtemp
 from time import mktime, time
 from unittest import main, TestCase
 
-from batcave.fileutil import prune
+from batcave.fileutil import prune, slurp, spew
 from batcave.sysutil import rmtree_hard
 
 
@@ -75,6 +75,25 @@ class TestPrune(TestCase):
         self._prune(age=2, force=True)
         self.assertEqual(self._full_file_list[:-4], self._file_list)
 
+
+class TestSlurpSpew(TestCase):
+    def setUp(self):
+        self._tempdir = Path(mkdtemp()).resolve()
+        self._file = self._tempdir / 'lines.txt'
+
+    def tearDown(self):
+        rmtree_hard(self._tempdir)
+
+    def test_round_trip(self):
+        lines = ['first\n', 'second\n', 'no newline']
+        spew(self._file, lines)
+        self.assertEqual(slurp(self._file), lines)
+
+    def test_empty_file(self):
+        spew(self._file, [])
+        self.assertEqual(slurp(self._file), [])
+
+
 if __name__ == '__main__':
     main()
 
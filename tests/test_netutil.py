@@ -0,0 +1,50 @@
+"""Unit tests for the netutil module."""
+
+# pylint: disable=missing-class-docstring,missing-function-docstring,invalid-name
+# flake8: noqa
+
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from threading import Thread
+from unittest import main, TestCase
+
+from batcave.netutil import pooled_session
+
+
+class RecordingHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self.server.requests.append((self.client_address, self.headers.get('Authorization')))
+        self.send_response(200)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, *_args):
+        pass
+
+
+class TestPooledSession(TestCase):
+    def setUp(self):
+        self._server = HTTPServer(('127.0.0.1', 0), RecordingHandler)
+        self._server.requests = []
+        Thread(target=self._server.serve_forever, kwargs={'poll_interval': 0.01}, daemon=True).start()
+        self.addCleanup(self._server.server_close)
+        self.addCleanup(self._server.shutdown)
+        self._url = f'http://127.0.0.1:{self._server.server_port}/'
+
+    def test_auth(self):
+        with pooled_session(('user', 'password')) as session:
+            session.get(self._url, timeout=10).raise_for_status()
+        self.assertEqual(self._server.requests[0][1], 'Basic dXNlcjpwYXNzd29yZA==')
+
+    def test_connection_reuse(self):
+        with pooled_session() as session:
+            for _ in range(3):
+                session.get(self._url, timeout=10).raise_for_status()
+        self.assertEqual(len({client for (client, _) in self._server.requests}), 1)
+
+
+if __name__ == '__main__':
+    main()
+
+# cSpell:ignore batcave netutil dXNlcjpwYXNzd29yZA
@@ -4,24 +4,57 @@
 # flake8: noqa
 
 from enum import Enum
-from multiprocessing import Process, Queue
-from os import chdir, fdopen, getcwd, getenv
+from multiprocessing import get_context
+from os import chdir, close, getcwd, getenv, open as os_open, write, O_CREAT, O_TRUNC, O_WRONLY
 from pathlib import Path
+from queue import Empty
 from stat import S_IRGRP, S_IROTH, S_IRUSR
 from sys import platform
-from tempfile import mkdtemp, mkstemp
+from tempfile import mkstemp, TemporaryDirectory
 from unittest import main, TestCase
 
+from batcave.lang import DEFAULT_ENCODING
 from batcave.sysutil import (chmod, CMDError, get_app_config_dir, get_app_data_dir,
                              LockError, LockFile, LockMode, OSUtilError,
                              popd, pushd, rmpath, rmtree_hard, syscmd, SysCmdRunner)
 
 LockSignal = Enum('LockSignal', ('true', 'false'))
+LOCK_TIMEOUT = 10
+
+# The lock worker only needs LockFile, so fork it on POSIX instead of paying to spawn (or forkserver) a fresh interpreter
+_MP_CONTEXT = get_context('spawn' if (platform == 'win32') else 'fork')
+
+_HOME = Path.home()
+_LOCALAPPDATA = getenv('LOCALAPPDATA', '')
+_APPDATA = getenv('APPDATA', '')
+_XDG_DATA = getenv('XDG_DATA_HOME', _HOME / '.local/share')
+_XDG_CONFIG = getenv('XDG_CONFIG_HOME', _HOME / '.config')
+
+
+def write_test_file(filename):
+    fd = os_open(filename, O_WRONLY | O_CREAT | O_TRUNC, 0o600)
+    try:
+        write(fd, b'test')
+    finally:
+        close(fd)
 
 
 class TestAppDirs(TestCase):
     APP_NAME = 'TestBatCaveApp'
 
+    @classmethod
+    def setUpClass(cls):
+        match platform:
+            case 'win32':
+                cls._expected_data = Path(_LOCALAPPDATA) / cls.APP_NAME
+                cls._expected_config = Path(_APPDATA) / cls.APP_NAME
+            case 'darwin':
+                cls._expected_data = _HOME / 'Library/Application Support' / cls.APP_NAME
+                cls._expected_config = _HOME / 'Library/Preferences' / cls.APP_NAME
+            case _:
+                cls._expected_data = Path(_XDG_DATA) / cls.APP_NAME
+                cls._expected_config = Path(_XDG_CONFIG) / cls.APP_NAME
+
     def test_data_dir_return_type(self):
         self.assertIsInstance(get_app_data_dir(self.APP_NAME), Path)
 
@@ -35,76 +68,54 @@ class TestAppDirs(TestCase):
         self.assertEqual(get_app_config_dir(self.APP_NAME).name, self.APP_NAME)
 
     def test_data_dir_platform_path(self):
-        match platform:
-            case 'win32':
-                expected = Path(getenv('LOCALAPPDATA', '')) / self.APP_NAME
-            case 'darwin':
-                expected = Path.home() / 'Library/Application Support' / self.APP_NAME
-            case _:
-                expected = Path(getenv('XDG_DATA_HOME', Path.home() / '.local/share')) / self.APP_NAME
-        self.assertEqual(get_app_data_dir(self.APP_NAME), expected)
+        self.assertEqual(get_app_data_dir(self.APP_NAME), self._expected_data)
 
     def test_config_dir_platform_path(self):
-        match platform:
-            case 'win32':
-                expected = Path(getenv('APPDATA', '')) / self.APP_NAME
-            case 'darwin':
-                expected = Path.home() / 'Library/Preferences' / self.APP_NAME
-            case _:
-                expected = Path(getenv('XDG_CONFIG_HOME', Path.home() / '.config')) / self.APP_NAME
-        self.assertEqual(get_app_config_dir(self.APP_NAME), expected)
+        self.assertEqual(get_app_config_dir(self.APP_NAME), self._expected_config)
 
 
 class TestChmod(TestCase):
+    def setUp(self):
+        self._tempdir = Path(self.enterContext(TemporaryDirectory()))  # pylint: disable=consider-using-with
+
     def test_chmod_directory(self):
-        tempdir = Path(mkdtemp())
-        try:
-            chmod(tempdir, S_IRUSR | S_IRGRP | S_IROTH)
-            mode = tempdir.stat().st_mode
-            match platform:
-                case 'win32':
-                    pass  # Windows chmod is limited
-                case _:
-                    self.assertTrue(mode & S_IRUSR)
-        finally:
-            tempdir.chmod(0o700)
-            tempdir.rmdir()
+        self.addCleanup(self._tempdir.chmod, 0o700)
+        chmod(self._tempdir, S_IRUSR | S_IRGRP | S_IROTH)
+        mode = self._tempdir.stat().st_mode
+        match platform:
+            case 'win32':
+                pass  # Windows chmod is limited
+            case _:
+                self.assertTrue(mode & S_IRUSR)
 
     def test_chmod_recursive(self):
-        tempdir = Path(mkdtemp())
-        subdir = tempdir / 'sub'
+        subdir = self._tempdir / 'sub'
         subdir.mkdir()
         testfile = subdir / 'file.txt'
-        testfile.write_text('test')
-        try:
-            chmod(tempdir, 0o755, recursive=True)
-            match platform:
-                case 'win32':
-                    pass  # Windows chmod is limited
-                case _:
-                    self.assertTrue(subdir.stat().st_mode & S_IRUSR)
-                    self.assertTrue(testfile.stat().st_mode & S_IRUSR)
-        finally:
-            rmtree_hard(tempdir)
+        write_test_file(testfile)
+        chmod(self._tempdir, 0o755, recursive=True)
+        match platform:
+            case 'win32':
+                pass  # Windows chmod is limited
+            case _:
+                sub_mode = subdir.stat().st_mode
+                file_mode = testfile.stat().st_mode
+                self.assertTrue(sub_mode & S_IRUSR)
+                self.assertTrue(file_mode & S_IRUSR)
 
     def test_chmod_files_only(self):
-        tempdir = Path(mkdtemp())
-        testfile = tempdir / 'file.txt'
-        testfile.write_text('test')
-        try:
-            original_dir_mode = tempdir.stat().st_mode
-            chmod(tempdir, 0o644, recursive=True, files_only=True)
-            self.assertEqual(tempdir.stat().st_mode, original_dir_mode)
-        finally:
-            rmtree_hard(tempdir)
+        testfile = self._tempdir / 'file.txt'
+        write_test_file(testfile)
+        original_dir_mode = self._tempdir.stat().st_mode
+        chmod(self._tempdir, 0o644, recursive=True, files_only=True)
+        new_dir_mode = self._tempdir.stat().st_mode
+        self.assertEqual(new_dir_mode, original_dir_mode)
 
 
 class TestDirStack(TestCase):
-    def setUp(self):
-        self._tempdir = Path(mkdtemp()).resolve()
-
-    def tearDown(self):
-        self._tempdir.rmdir()
+    @classmethod
+    def setUpClass(cls):
+        cls._tempdir = Path(cls.enterClassContext(TemporaryDirectory())).resolve()  # pylint: disable=consider-using-with
 
     def test_popd_empty_stack(self):
         self.assertEqual(popd(), 0)
@@ -124,134 +135,141 @@ class TestDirStack(TestCase):
 
 
 class TestExceptions(TestCase):
-    def test_PlatformException(self):
-        try:
-            raise CMDError(CMDError.INVALID_OPERATION, platform='bad-platform')
-        except CMDError as err:
-            self.assertEqual(CMDError.INVALID_OPERATION.code, err.code)
+    def test_error_codes(self):
+        for (err_class, error, kwargs) in ((CMDError, CMDError.INVALID_OPERATION, {'platform': 'bad-platform'}),
+                                           (OSUtilError, OSUtilError.GROUP_EXISTS, {'group': 'test_group'}),
+                                           (OSUtilError, OSUtilError.INVALID_OPERATION, {'platform': 'bad-platform'}),
+                                           (OSUtilError, OSUtilError.USER_EXISTS, {'user': 'testuser'})):
+            with self.subTest(error=err_class.__name__, code=error.code):
+                with self.assertRaises(err_class) as context:
+                    raise err_class(error, **kwargs)
+                self.assertEqual(error.code, context.exception.code)
 
 
 class TestLockFile(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._lock_requests = _MP_CONTEXT.Queue()
+        cls._got_lock = _MP_CONTEXT.Queue()
+        cls._lock_again = _MP_CONTEXT.Process(target=secondary_lock_process, args=(cls._lock_requests, cls._got_lock))
+        cls._lock_again.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._lock_requests.put(None)
+        cls._lock_again.join(LOCK_TIMEOUT)
+        if cls._lock_again.is_alive():
+            cls._lock_again.terminate()
+        cls._lock_requests.close()
+        cls._got_lock.close()
+
     def setUp(self):
-        (fd, fn) = mkstemp()
-        self._fh = fdopen(fd)
+        (fd, fn) = mkstemp(dir=self.enterContext(TemporaryDirectory()))  # pylint: disable=consider-using-with
+        close(fd)
         self._fn = Path(fn)
-        self._got_lock = Queue()
-        self._lock_again = Process(target=secondary_lock_process, args=(self._fn, self._got_lock))
+        while not self._got_lock.empty():  # discard any late signal left by a test that timed out
+            self._got_lock.get()
 
-    def tearDown(self):
-        self._got_lock.close()
-        self._fh.close()
-        if self._fn.exists():
-            self._fn.unlink()
+    def _get_lock_signal(self):
+        try:
+            return self._got_lock.get(timeout=LOCK_TIMEOUT)
+        except Empty:
+            self.fail('The secondary lock process did not signal')
 
     def test_1_cleanup(self):
-        with LockFile(self._fn, handle=self._fh, cleanup=True):
+        with LockFile(self._fn, cleanup=True):
             pass
         self.assertFalse(self._fn.exists())
 
     def test_2_no_cleanup(self):
-        with LockFile(self._fn, handle=self._fh, cleanup=False):
+        with LockFile(self._fn, cleanup=False):
             pass
         self.assertTrue(self._fn.exists())
 
     def test_3_lock(self):
-        with LockFile(self._fn, handle=self._fh, cleanup=True):
-            self._lock_again.start()
-            got_lock = self._got_lock.get()
-            self._lock_again.join()
+        with LockFile(self._fn, cleanup=True):
+            self._lock_requests.put(self._fn)
+            got_lock = self._get_lock_signal()
             self.assertTrue(got_lock == LockSignal.false)
 
     def test_4_unlock(self):
-        with LockFile(self._fn, handle=self._fh, cleanup=True) as lockfile:
+        with LockFile(self._fn, cleanup=True) as lockfile:
             lockfile.action(LockMode.unlock)
-            self._lock_again.start()
-            got_lock = self._got_lock.get()
-            self._lock_again.join()
+            self._lock_requests.put(self._fn)
+            got_lock = self._get_lock_signal()
             lockfile.action(LockMode.lock)
             self.assertTrue(got_lock == LockSignal.true)
 
 
-def secondary_lock_process(filename, queue):
-    try:
-        with LockFile(filename, cleanup=False) as lock_again:
-            lock_again.action(LockMode.unlock)
-            queue.put(LockSignal.true)
-    except LockError:
-        queue.put(LockSignal.false)
-
-
-class TestOSUtilError(TestCase):
-    def test_group_exists(self):
-        try:
-            raise OSUtilError(OSUtilError.GROUP_EXISTS, group='test_group')
-        except OSUtilError as err:
-            self.assertEqual(OSUtilError.GROUP_EXISTS.code, err.code)
-
-    def test_invalid_operation(self):
-        try:
-            raise OSUtilError(OSUtilError.INVALID_OPERATION, platform='bad-platform')
-        except OSUtilError as err:
-            self.assertEqual(OSUtilError.INVALID_OPERATION.code, err.code)
-
-    def test_user_exists(self):
-        try:
-            raise OSUtilError(OSUtilError.USER_EXISTS, user='testuser')
-        except OSUtilError as err:
-            self.assertEqual(OSUtilError.USER_EXISTS.code, err.code)
+def secondary_lock_process(requests, results):
+    while (filename := requests.get()) is not None:
+        # LockFile cannot close a handle it opened if the lock fails in __init__, so the worker owns the handle
+        with open(filename, 'w', encoding=DEFAULT_ENCODING) as lock_handle:
+            try:
+                with LockFile(filename, lock_handle, cleanup=False) as lock_again:
+                    lock_again.action(LockMode.unlock)
+                    results.put(LockSignal.true)
+            except LockError:
+                results.put(LockSignal.false)
 
 
 class TestRmPath(TestCase):
+    def setUp(self):
+        self._root = Path(self.enterContext(TemporaryDirectory()))  # pylint: disable=consider-using-with
+
     def test_remove_file(self):
-        (fd, fn) = mkstemp()
-        fdopen(fd).close()
+        (fd, fn) = mkstemp(dir=self._root)
+        close(fd)
         path = Path(fn)
         self.assertTrue(path.exists())
         rmpath(path)
         self.assertFalse(path.exists())
 
     def test_remove_directory(self):
-        tempdir = Path(mkdtemp())
+        (tempdir := self._root / 'tree').mkdir()
         self.assertTrue(tempdir.exists())
         rmpath(tempdir)
         self.assertFalse(tempdir.exists())
 
     def test_remove_directory_with_contents(self):
-        tempdir = Path(mkdtemp())
+        (tempdir := self._root / 'tree').mkdir()
         (tempdir / 'subdir').mkdir()
-        (tempdir / 'subdir' / 'file.txt').write_text('test')
-        (tempdir / 'file.txt').write_text('test')
+        write_test_file(tempdir / 'subdir' / 'file.txt')
+        write_test_file(tempdir / 'file.txt')
         rmpath(tempdir)
         self.assertFalse(tempdir.exists())
 
 
 class TestRmtreeHard(TestCase):
+    def setUp(self):
+        self._root = Path(self.enterContext(TemporaryDirectory()))  # pylint: disable=consider-using-with
+
     def test_remove_tree(self):
-        tempdir = Path(mkdtemp())
+        (tempdir := self._root / 'tree').mkdir()
         (tempdir / 'subdir').mkdir()
-        (tempdir / 'subdir' / 'file.txt').write_text('test')
+        write_test_file(tempdir / 'subdir' / 'file.txt')
         rmtree_hard(tempdir)
         self.assertFalse(tempdir.exists())
 
     def test_remove_readonly_tree(self):
-        tempdir = Path(mkdtemp())
+        (tempdir := self._root / 'tree').mkdir()
         readonly_file = tempdir / 'readonly.txt'
-        readonly_file.write_text('test')
+        write_test_file(readonly_file)
         readonly_file.chmod(S_IRUSR | S_IRGRP | S_IROTH)
         rmtree_hard(tempdir)
         self.assertFalse(tempdir.exists())
 
     def test_remove_readonly_directory(self):
-        tempdir = Path(mkdtemp())
+        (tempdir := self._root / 'tree').mkdir()
         readonly_dir = tempdir / 'readonly_dir'
         readonly_dir.mkdir()
-        (readonly_dir / 'file.txt').write_text('test')
+        write_test_file(readonly_dir / 'file.txt')
         readonly_dir.chmod(S_IRUSR | S_IRGRP | S_IROTH)
         rmtree_hard(tempdir)
         self.assertFalse(tempdir.exists())
 
     def test_remove_tree_while_cwd_inside(self):
-        tempdir = Path(mkdtemp())
+        (tempdir := self._root / 'tree').mkdir()
         original_cwd = getcwd()
         try:
             chdir(tempdir)
@@ -269,7 +287,7 @@ class TestSysCmd(TestCase):
                 result = syscmd('cmd', '/c', 'echo', 'hello')
             case _:
                 result = syscmd('echo', 'hello')
-        self.assertTrue(any('hello' in line for line in result))
+        self.assertIn('hello', '\n'.join(result))
 
     def test_flatten_output(self):
         match platform:
@@ -291,15 +309,17 @@ class TestSysCmd(TestCase):
 
 
 class TestSysCmdRunner(TestCase):
-    def test_basic_run(self):
+    @classmethod
+    def setUpClass(cls):
         match platform:
             case 'win32':
-                runner = SysCmdRunner('cmd', '/c', 'echo', show_cmd=False, show_stdout=False)
-                result = runner.run('hello')
+                cls._runner = SysCmdRunner('cmd', '/c', 'echo', show_cmd=False, show_stdout=False)
             case _:
-                runner = SysCmdRunner('echo', show_cmd=False, show_stdout=False)
-                result = runner.run('hello')
-        self.assertTrue(any('hello' in line for line in result))
+                cls._runner = SysCmdRunner('echo', show_cmd=False, show_stdout=False)
+
+    def test_basic_run(self):
+        result = self._runner.run('hello')
+        self.assertIn('hello', '\n'.join(result))
 
 
 if __name__ == '__main__':